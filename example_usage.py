@@ -6,13 +6,10 @@ This script demonstrates how to use the RDFToCSVConverter class
 to convert DBpedia or other RDF TTL files to CSV format.
 """
 
-import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add the current directory to the path so we can import our converter
-sys.path.append(str(Path(__file__).parent))
-
 from rdf_to_csv_converter import RDFToCSVConverter
 
 def example_basic_conversion(ttl_file_path: str):
@@ -39,26 +36,32 @@ def example_skip_unlabeled(ttl_file_path: str):
     print("\n=== Skip Unlabeled Nodes Example ===")
     
     converter = RDFToCSVConverter(ttl_file_path)
-    
-    # First run with all nodes
-    print("Converting with all nodes...")
-    edges_file_all, nodes_file_all = converter.convert(
-        edges_filename="all_nodes_edges.csv",
-        nodes_filename="all_nodes_nodes.csv"
-    )
+    converter.load()
+
+    # The clone shares the parsed graph, so both conversions run
+    # concurrently without re-parsing; CSV writes release the GIL
+    labeled_converter = converter.clone_for_convert()
+
+    print("Converting with all nodes and with skip_unlabeled=True concurrently...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        all_future = executor.submit(
+            converter.convert,
+            edges_filename="all_nodes_edges.csv",
+            nodes_filename="all_nodes_nodes.csv"
+        )
+        labeled_future = executor.submit(
+            labeled_converter.convert,
+            skip_unlabeled=True,
+            edges_filename="labeled_only_edges.csv",
+            nodes_filename="labeled_only_nodes.csv",
+            statistics_filename="labeled_only_statistics.txt",
+            schema_filename="labeled_only_schema.json"
+        )
+        edges_file_all, nodes_file_all = all_future.result()
+        edges_file_labeled, nodes_file_labeled = labeled_future.result()
+
     stats_all = converter.generate_statistics()
-    
-    # Reset converter for second run
-    converter = RDFToCSVConverter(ttl_file_path)
-    
-    # Second run skipping unlabeled nodes
-    print("Converting with skip_unlabeled=True...")
-    edges_file_labeled, nodes_file_labeled = converter.convert(
-        skip_unlabeled=True,
-        edges_filename="labeled_only_edges.csv",
-        nodes_filename="labeled_only_nodes.csv"
-    )
-    stats_labeled = converter.generate_statistics()
+    stats_labeled = labeled_converter.generate_statistics()
     
     print(f"\nComparison:")
     print(f"  All nodes:")
@@ -173,15 +176,8 @@ dbr:Poland rdf:type dbo:Country ;
     rdfs:label "Poland"@en .
 """
     
-    # Save sample data
-    sample_file = Path("sample_dbpedia.ttl")
-    with open(sample_file, 'w', encoding='utf-8') as f:
-        f.write(sample_ttl)
-    
-    print(f"Created sample file: {sample_file}")
-    
-    # Convert the sample
-    converter = RDFToCSVConverter(str(sample_file))
+    # Parse the sample directly from memory; no temp file on disk needed
+    converter = RDFToCSVConverter.from_string(sample_ttl, name="sample_dbpedia")
     edges_file, nodes_file = converter.convert(
         edges_filename="sample_edges.csv",
         nodes_filename="sample_nodes.csv"
@@ -191,16 +187,13 @@ dbr:Poland rdf:type dbo:Country ;
     print(f"  Edges: {edges_file}")
     print(f"  Nodes: {nodes_file}")
     
-    # Show some sample data
-    import pandas as pd
-    
+    # Show some sample data straight from the converter's in-memory tables,
+    # skipping a redundant read+parse of the CSVs just written
     print("\nSample Edges (first 5 rows):")
-    edges_df = pd.read_csv(edges_file)
-    print(edges_df.head().to_string(index=False))
-    
+    print(converter.edges_dataframe().head().to_string(index=False))
+
     print("\nSample Nodes (first 5 rows):")
-    nodes_df = pd.read_csv(nodes_file)
-    print(nodes_df.head().to_string(index=False))
+    print(converter.nodes_dataframe().head().to_string(index=False))
 
 
 def main():
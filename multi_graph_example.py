@@ -11,6 +11,7 @@ Date: July 2025
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rdf_to_csv_converter import RDFToCSVConverter
 
@@ -28,20 +29,22 @@ def run_multi_graph_example():
     
     # Additional graphs to compare
     additional_graphs = []
-    
-    # Check which additional graphs are available
-    potential_graphs = [
-        ttl_data_dir / "imbor.ttl",
-        ttl_data_dir / "nen2660.ttl"
-    ]
-    
-    for graph_path in potential_graphs:
-        if graph_path.exists():
-            additional_graphs.append(str(graph_path))
-            print(f"✅ Found additional graph: {graph_path.name}")
+
+    # Check which additional graphs are available with a single directory
+    # scan instead of one stat() call per candidate file
+    potential_graph_names = ["imbor.ttl", "nen2660.ttl"]
+    try:
+        present_files = {entry.name for entry in os.scandir(ttl_data_dir) if entry.is_file()}
+    except FileNotFoundError:
+        present_files = set()
+
+    for graph_name in potential_graph_names:
+        if graph_name in present_files:
+            additional_graphs.append(str(ttl_data_dir / graph_name))
+            print(f"✅ Found additional graph: {graph_name}")
         else:
-            print(f"⚠️  Optional graph not found: {graph_path.name}")
-    
+            print(f"⚠️  Optional graph not found: {graph_name}")
+
     if not primary_graph.exists():
         print(f"❌ Primary graph not found: {primary_graph}")
         print("Please ensure you have TTL files in the ttl_data directory")
@@ -56,106 +59,123 @@ def run_multi_graph_example():
         # Create converter with multiple graphs
         print(f"\n🚀 Creating multi-graph converter...")
         converter = RDFToCSVConverter(
-            str(primary_graph), 
-            output_dir="output", 
-            additional_graphs=additional_graphs
+            str(primary_graph),
+            output_dir="output",
+            additional_graphs=additional_graphs,
+            parallel_parse=True
         )
         
-        # Convert with specific filters to focus on relationships
+        # Run the filtered conversion and the labeled-only version
+        # concurrently; the clone shares the parsed graph so the files are
+        # only parsed once
+        converter.load()
+        labeled_converter = converter.clone_for_convert()
+
         print("🔄 Converting graphs and finding connections...")
-        edges_file, nodes_file = converter.convert(
-            include_literals=False,
-            filter_predicates=[
-                'rdf:type', 
-                'rdfs:subClassOf', 
-                'rdfs:subPropertyOf',
-                'owl:equivalentClass',
-                'owl:equivalentProperty',
-                'skos:exactMatch',
-                'skos:closeMatch',
-                'skos:relatedMatch'
-            ]
-        )
-        
-        # Also create a cleaner version with only labeled nodes
-        print("\n🏷️ Creating labeled-only version for cleaner visualization...")
-        labeled_edges, labeled_nodes = converter.convert(
-            include_literals=False,
-            skip_unlabeled=True,
-            edges_filename="multi_graph_labeled_edges.csv",
-            nodes_filename="multi_graph_labeled_nodes.csv"
-        )
+        print("🏷️ Also creating labeled-only version for cleaner visualization...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            filtered_future = executor.submit(
+                converter.convert,
+                include_literals=False,
+                filter_predicates=[
+                    'rdf:type',
+                    'rdfs:subClassOf',
+                    'rdfs:subPropertyOf',
+                    'owl:equivalentClass',
+                    'owl:equivalentProperty',
+                    'skos:exactMatch',
+                    'skos:closeMatch',
+                    'skos:relatedMatch'
+                ]
+            )
+            labeled_future = executor.submit(
+                labeled_converter.convert,
+                include_literals=False,
+                skip_unlabeled=True,
+                edges_filename="multi_graph_labeled_edges.csv",
+                nodes_filename="multi_graph_labeled_nodes.csv",
+                statistics_filename="multi_graph_labeled_statistics.txt",
+                schema_filename="multi_graph_labeled_schema.json"
+            )
+            edges_file, nodes_file = filtered_future.result()
+            labeled_edges, labeled_nodes = labeled_future.result()
         
         # Get comprehensive statistics
         stats = converter.generate_statistics()
-        
-        print(f"\n📈 Conversion Results:")
-        print(f"Total nodes extracted: {stats['total_nodes']}")
-        print(f"Total edges extracted: {stats['total_edges']}")
-        print(f"Output files:")
-        print(f"  📄 Edges: {edges_file}")
-        print(f"  📄 Nodes: {nodes_file}")
-        
+
+        # Accumulate the report and write it in one go rather than issuing
+        # one write syscall per line inside the loops below
+        lines = []
+
+        lines.append(f"\n📈 Conversion Results:")
+        lines.append(f"Total nodes extracted: {stats['total_nodes']}")
+        lines.append(f"Total edges extracted: {stats['total_edges']}")
+        lines.append(f"Output files:")
+        lines.append(f"  📄 Edges: {edges_file}")
+        lines.append(f"  📄 Nodes: {nodes_file}")
+
         # Multi-graph analysis
         if len(stats['graph_statistics']) > 1:
-            print(f"\n🔗 Multi-Graph Analysis:")
-            print(f"Graphs analyzed: {len(stats['graph_statistics'])}")
-            
+            lines.append(f"\n🔗 Multi-Graph Analysis:")
+            lines.append(f"Graphs analyzed: {len(stats['graph_statistics'])}")
+
             for graph_name, graph_info in stats['graph_statistics'].items():
-                print(f"\n  📊 {graph_name}:")
-                print(f"    Triples: {graph_info['triples_count']:,}")
-                print(f"    Unique nodes: {len(graph_info.get('nodes', []))}")
-                print(f"    Unique predicates: {len(graph_info.get('predicates', []))}")
-            
+                lines.append(f"\n  📊 {graph_name}:")
+                lines.append(f"    Triples: {graph_info['triples_count']:,}")
+                lines.append(f"    Unique nodes: {len(graph_info.get('nodes', []))}")
+                lines.append(f"    Unique predicates: {len(graph_info.get('predicates', []))}")
+
             # Cross-graph connections
             connections = stats['cross_graph_connections']
             if connections:
-                print(f"\n🌐 Cross-Graph Connections Found: {len(connections)}")
-                
+                lines.append(f"\n🌐 Cross-Graph Connections Found: {len(connections)}")
+
                 # Group by connection type
                 shared_uri_connections = [c for c in connections if c.get('type') != 'similar_concept']
                 similar_concept_connections = [c for c in connections if c.get('type') == 'similar_concept']
-                
+
                 if shared_uri_connections:
-                    print(f"\n  🔗 Shared URI Connections:")
+                    lines.append(f"\n  🔗 Shared URI Connections:")
                     for conn in shared_uri_connections[:5]:  # Show top 5
-                        print(f"    {conn['graph1']} ↔ {conn['graph2']}: {conn['connection_strength']} shared elements")
+                        lines.append(f"    {conn['graph1']} ↔ {conn['graph2']}: {conn['connection_strength']} shared elements")
                         if conn.get('shared_nodes'):
-                            print(f"      Shared nodes: {len(conn['shared_nodes'])}")
+                            lines.append(f"      Shared nodes: {len(conn['shared_nodes'])}")
                         if conn.get('shared_predicates'):
-                            print(f"      Shared predicates: {len(conn['shared_predicates'])}")
-                
+                            lines.append(f"      Shared predicates: {len(conn['shared_predicates'])}")
+
                 if similar_concept_connections:
-                    print(f"\n  🔄 Similar Concepts Across Graphs:")
+                    lines.append(f"\n  🔄 Similar Concepts Across Graphs:")
                     for conn in similar_concept_connections[:5]:  # Show top 5
-                        print(f"    '{conn['label']}' appears in {len(conn['graphs'])} graphs")
-                        print(f"      Graphs: {', '.join(conn['graphs'])}")
+                        lines.append(f"    '{conn['label']}' appears in {len(conn['graphs'])} graphs")
+                        lines.append(f"      Graphs: {', '.join(conn['graphs'])}")
             else:
-                print(f"\n❌ No cross-graph connections found")
-                print("This could mean:")
-                print("  - Graphs are completely independent")
-                print("  - Different URI schemes are used")
-                print("  - Concepts are expressed differently")
-        
+                lines.append(f"\n❌ No cross-graph connections found")
+                lines.append("This could mean:")
+                lines.append("  - Graphs are completely independent")
+                lines.append("  - Different URI schemes are used")
+                lines.append("  - Concepts are expressed differently")
+
         # Label extraction statistics
         label_stats = stats['label_statistics']
-        print(f"\n🏷️  Label Extraction Summary:")
-        print(f"SKOS prefLabels: {label_stats['skos_preflabels']}")
-        print(f"RDFS labels: {label_stats['rdfs_labels']}")
-        print(f"URI fragments: {label_stats['uri_fragments']}")
-        print(f"SKOS definitions: {label_stats['skos_definitions']}")
-        
+        lines.append(f"\n🏷️  Label Extraction Summary:")
+        lines.append(f"SKOS prefLabels: {label_stats['skos_preflabels']}")
+        lines.append(f"RDFS labels: {label_stats['rdfs_labels']}")
+        lines.append(f"URI fragments: {label_stats['uri_fragments']}")
+        lines.append(f"SKOS definitions: {label_stats['skos_definitions']}")
+
         # Usage suggestions
-        print(f"\n💡 Usage Suggestions:")
-        print(f"1. Import {Path(edges_file).name} and {Path(nodes_file).name} into Cosmograph")
-        print(f"2. Color nodes by 'graphs' column to see which graph they come from")
-        print(f"3. Filter by 'source_graph' in edges to analyze specific graph relationships")
-        print(f"4. Look for nodes with multiple graphs to find connection points")
-        
+        lines.append(f"\n💡 Usage Suggestions:")
+        lines.append(f"1. Import {Path(edges_file).name} and {Path(nodes_file).name} into Cosmograph")
+        lines.append(f"2. Color nodes by 'graphs' column to see which graph they come from")
+        lines.append(f"3. Filter by 'source_graph' in edges to analyze specific graph relationships")
+        lines.append(f"4. Look for nodes with multiple graphs to find connection points")
+
         if len(stats['graph_statistics']) > 1:
-            print(f"5. Cross-graph connections indicate potential alignment opportunities")
-        
-        print(f"\n✅ Multi-graph analysis completed successfully!")
+            lines.append(f"5. Cross-graph connections indicate potential alignment opportunities")
+
+        lines.append(f"\n✅ Multi-graph analysis completed successfully!")
+
+        print('\n'.join(lines))
         
     except Exception as e:
         print(f"❌ Error during conversion: {e}")
@@ -41,8 +41,15 @@ setup(
     install_requires=[
         "rdflib>=6.0.0",
         "pandas>=1.3.0",
+        "numpy>=1.20.0",
     ],
     extras_require={
+        "parquet": [
+            "pyarrow>=7.0",
+        ],
+        "fastparse": [
+            "pyoxigraph>=0.3",
+        ],
         "dev": [
             "pytest>=6.0",
             "black>=21.0",
@@ -60,15 +60,17 @@ def test_skip_unlabeled():
         # Test 1: Convert with all nodes
         print("\n📊 Test 1: Converting with all nodes...")
         converter_all = RDFToCSVConverter(test_file)
+        converter_all.load()
         edges_all, nodes_all = converter_all.convert(
             edges_filename="test_all_edges.csv",
             nodes_filename="test_all_nodes.csv"
         )
         stats_all = converter_all.generate_statistics()
-        
-        # Test 2: Convert skipping unlabeled nodes
+
+        # Test 2: Convert skipping unlabeled nodes, reusing the already
+        # parsed graph instead of parsing the test file a second time
         print("📊 Test 2: Converting with skip_unlabeled=True...")
-        converter_labeled = RDFToCSVConverter(test_file)
+        converter_labeled = converter_all.clone_for_convert()
         edges_labeled, nodes_labeled = converter_labeled.convert(
             skip_unlabeled=True,
             edges_filename="test_labeled_edges.csv",